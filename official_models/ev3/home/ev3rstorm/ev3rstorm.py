@@ -17,15 +17,25 @@ from pybricks.media.ev3dev import ImageFile, SoundFile
 from pybricks.parameters import Button, Direction, Port, Stop
 from pybricks.tools import wait
 
+from _thread import allocate_lock, start_new_thread
+from micropython import const
 from random import randint
 
 from rc_tank_util import RemoteControlledTank
 
 
+# below this ambient light intensity (%), Ev3rstorm is in the dark
+_AMBIENT_DARK = const(15)
+
+
 class Ev3rstorm(RemoteControlledTank):
     WHEEL_DIAMETER = 26   # milimeters
     AXLE_TRACK = 102      # milimeters
 
+    # the medium motor makes 3 rotations per bazooka blast
+    BLAST_DEGREES = 3 * 360
+    BLAST_SPEED = 2 * BLAST_DEGREES   # deg/s
+
     def __init__(
             self,
             left_track_motor_port: Port = Port.B,
@@ -52,6 +62,14 @@ class Ev3rstorm(RemoteControlledTank):
         self.touch_sensor = TouchSensor(port=touch_sensor_port)
         self.color_sensor = ColorSensor(port=color_sensor_port)
 
+        # held by whoever is using the motors:
+        # the main loop while driving, the touch handler while blasting
+        self._lock = allocate_lock()
+
+        # set by the Touch Sensor watcher if it fails,
+        # for the main loop to stop the program with
+        self._touch_handler_error = None
+
     def dance_randomly_if_ir_beacon_button_pressed(self):
         """
         Ev3rstorm dances by turning by random angles on the spot
@@ -61,35 +79,70 @@ class Ev3rstorm(RemoteControlledTank):
                 self.ir_sensor.buttons(channel=self.ir_beacon_channel):
             self.drive_base.turn(angle=randint(-360, 360))
 
-    def blast_bazooka_if_touched(self):
+            # the turn leaves the Driving Base stopped,
+            # so the IR beacon driver has to send its next command again
+            self.ir_driver.reset()
+
+    def watch_touch_sensor(self, handler):
         """
-        Ev3rstorm blasts his bazooka when his Touch Sensor is pressed
-        (inspiration from LEGO Mindstorms EV3 Home Ed.: Ev3rstorm: Tutorial #5)
+        Background worker calling the handler on each new press
+        of the Touch Sensor, so that the main loop never has to query it;
+        the sensor is sampled once per control loop period;
+        any error is handed over to the main loop instead of
+        silently ending this thread
         """
-        MEDIUM_MOTOR_ROTATIONAL_DEGREES_PER_BLAST = 3 * 360
+        was_pressed = False
 
-        if self.touch_sensor.pressed():
-            if self.color_sensor.ambient() < 15:
-                self.ev3_brick.speaker.play_file(file=SoundFile.UP)
+        try:
+            while True:
+                is_pressed = self.touch_sensor.pressed()
 
-                self.bazooka_blast_motor.run_angle(
-                    speed=2 * MEDIUM_MOTOR_ROTATIONAL_DEGREES_PER_BLAST,
-                    rotation_angle=-MEDIUM_MOTOR_ROTATIONAL_DEGREES_PER_BLAST,
-                    then=Stop.HOLD,
-                    wait=True)
+                if is_pressed and not was_pressed:
+                    with self._lock:
+                        handler()
 
-                self.ev3_brick.speaker.play_file(file=SoundFile.LAUGHING_1)
+                was_pressed = is_pressed
+                wait(1000 // self.CONTROL_LOOP_FREQUENCY)
 
-            else:
-                self.ev3_brick.speaker.play_file(file=SoundFile.DOWN)
+        except Exception as error:
+            self._touch_handler_error = error
 
-                self.bazooka_blast_motor.run_angle(
-                    speed=2 * MEDIUM_MOTOR_ROTATIONAL_DEGREES_PER_BLAST,
-                    rotation_angle=MEDIUM_MOTOR_ROTATIONAL_DEGREES_PER_BLAST,
-                    then=Stop.HOLD,
-                    wait=True)
+    def install_touch_handler(self, handler):
+        """
+        Call the handler from a background thread whenever
+        the Touch Sensor gets pressed
+        """
+        start_new_thread(self.watch_touch_sensor, (handler,))
 
-                self.ev3_brick.speaker.play_file(file=SoundFile.LAUGHING_2)
+    def blast_bazooka(self):
+        """
+        Ev3rstorm blasts his bazooka when his Touch Sensor is pressed,
+        upward in the dark and downward in the light,
+        laughing as the bazooka turns
+        (inspiration from LEGO Mindstorms EV3 Home Ed.: Ev3rstorm: Tutorial #5)
+        """
+        if self.color_sensor.ambient() < _AMBIENT_DARK:
+            direction = -1
+            blast_sound, laugh_sound = SoundFile.UP, SoundFile.LAUGHING_1
+
+        else:
+            direction = 1
+            blast_sound, laugh_sound = SoundFile.DOWN, SoundFile.LAUGHING_2
+
+        self.ev3_brick.speaker.play_file(file=blast_sound)
+
+        self.bazooka_blast_motor.run_angle(
+            speed=self.BLAST_SPEED,
+            rotation_angle=direction * self.BLAST_DEGREES,
+            then=Stop.HOLD,
+            wait=False)
+
+        self.ev3_brick.speaker.play_file(file=laugh_sound)
+
+        # the laugh plays while the bazooka motor turns;
+        # the blast is over once both have finished
+        while not self.bazooka_blast_motor.control.done():
+            wait(10)
 
     def main(
             self,
@@ -100,11 +153,21 @@ class Ev3rstorm(RemoteControlledTank):
         """
         self.ev3_brick.screen.load_image(ImageFile.TARGET)
 
+        self.install_touch_handler(self.blast_bazooka)
+
+        drive_by_ir_beacon = \
+            self.ir_beacon_driver(speed=driving_speed, turn_rate=90).step
+
         while True:
-            self.drive_by_ir_beacon(speed=driving_speed)
-            self.dance_randomly_if_ir_beacon_button_pressed()
-            self.blast_bazooka_if_touched()
-            wait(1)
+            if self._touch_handler_error is not None:
+                self.drive_base.stop()
+                raise self._touch_handler_error
+
+            with self._lock:
+                drive_by_ir_beacon()
+                self.dance_randomly_if_ir_beacon_button_pressed()
+
+            self.sleep_until_next_tick()
 
 
 if __name__ == '__main__':
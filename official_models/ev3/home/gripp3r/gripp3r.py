@@ -12,10 +12,9 @@ https://www.lego.com/en-us/themes/mindstorms/buildarobot
 """
 
 from pybricks.hubs import EV3Brick
-from pybricks.ev3devices import Motor, TouchSensor, InfraredSensor
+from pybricks.ev3devices import Motor, TouchSensor
 from pybricks.media.ev3dev import SoundFile
 from pybricks.parameters import Button, Direction, Port, Stop
-from pybricks.tools import wait
 
 from rc_tank_util import RemoteControlledTank
 
@@ -47,9 +46,6 @@ class Gripp3r(RemoteControlledTank):
 
         self.touch_sensor = TouchSensor(port=touch_sensor_port)
 
-        self.ir_sensor = InfraredSensor(port=ir_sensor_port)
-        self.ir_beacon_channel = ir_beacon_channel
-
     def grip_or_release_by_ir_beacon(self, speed: float = 500):
         if Button.BEACON in \
                 self.ir_sensor.buttons(channel=self.ir_beacon_channel):
@@ -89,10 +85,13 @@ class Gripp3r(RemoteControlledTank):
             then=Stop.COAST,
             wait=True)
 
+        drive_by_ir_beacon = \
+            self.ir_beacon_driver(speed=driving_speed, turn_rate=90).step
+
         while True:
-            self.drive_by_ir_beacon(speed=driving_speed)
+            drive_by_ir_beacon()
             self.grip_or_release_by_ir_beacon(speed=500)
-            wait(1)
+            self.sleep_until_next_tick()
 
 
 if __name__ == '__main__':
@@ -2,12 +2,130 @@ from pybricks.ev3devices import Motor, InfraredSensor
 from pybricks.robotics import DriveBase
 from pybricks.parameters import Button, Direction, Port
 
+from micropython import const
+from utime import sleep_us, ticks_add, ticks_diff, ticks_us
+
+
+# bit assigned to each IR beacon button,
+# so that any combination of pressed buttons maps to a single int
+_LEFT_UP = const(1 << 0)
+_RIGHT_UP = const(1 << 1)
+_LEFT_DOWN = const(1 << 2)
+_RIGHT_DOWN = const(1 << 3)
+_BEACON = const(1 << 4)
+
+_BITS = {
+    Button.LEFT_UP: _LEFT_UP,
+    Button.RIGHT_UP: _RIGHT_UP,
+    Button.LEFT_DOWN: _LEFT_DOWN,
+    Button.RIGHT_DOWN: _RIGHT_DOWN,
+    Button.BEACON: _BEACON
+}
+
+# pressed-buttons bitmask -> (speed sign, turn rate sign);
+# any combination not listed here stops the robot
+_DISPATCH = {
+    # forward
+    _LEFT_UP | _RIGHT_UP: (1, 0),
+
+    # backward
+    _LEFT_DOWN | _RIGHT_DOWN: (-1, 0),
+
+    # turn left on the spot
+    _LEFT_UP | _RIGHT_DOWN: (0, -1),
+
+    # turn right on the spot
+    _RIGHT_UP | _LEFT_DOWN: (0, 1),
+
+    # turn left forward
+    _LEFT_UP: (1, -1),
+
+    # turn right forward
+    _RIGHT_UP: (1, 1),
+
+    # turn left backward
+    _LEFT_DOWN: (-1, 1),
+
+    # turn right backward
+    _RIGHT_DOWN: (-1, -1)
+}
+
+
+class IRBeaconDriver:
+    """
+    Drives a Driving Base by the IR beacon
+    at a fixed speed (mm/s) and turn rate (deg/s)
+    """
+    __slots__ = (
+        'drive_base', 'ir_sensor', 'ir_beacon_channel', 'speed', 'turn_rate',
+        '_table', '_poll', '_drive', '_stop', '_channel', '_last_mask'
+    )
+
+    def __init__(
+            self,
+            drive_base: DriveBase, ir_sensor: InfraredSensor,
+            ir_beacon_channel: int = 1,
+            speed: float = 1000,    # mm/s
+            turn_rate: float = 90   # rotational speed deg/s
+            ):
+        self.drive_base = drive_base
+        self.ir_sensor = ir_sensor
+        self.ir_beacon_channel = ir_beacon_channel
+        self.speed = speed
+        self.turn_rate = turn_rate
+
+        # drive commands worked out once up front
+        self._table = {
+            mask: (speed_sign * speed, turn_rate_sign * turn_rate)
+            for mask, (speed_sign, turn_rate_sign) in _DISPATCH.items()
+        }
+
+        # bound methods cached for the IR beacon polling loop
+        self._poll = ir_sensor.buttons
+        self._drive = drive_base.drive
+        self._stop = drive_base.stop
+        self._channel = ir_beacon_channel
+
+        # make sure the first step sends a command
+        self.reset()
+
+    def reset(self):
+        """
+        Forget the last pressed buttons, so that the next step sends
+        a command again; call this after driving the Driving Base directly
+        """
+        self._last_mask = None
+
+    def step(self):
+        """
+        Drive according to the IR beacon buttons currently pressed;
+        a drive command is only sent when the pressed buttons change
+        """
+        ir_beacon_buttons_mask = 0
+        for button in self._poll(channel=self._channel):
+            ir_beacon_buttons_mask |= _BITS[button]
+
+        if ir_beacon_buttons_mask == self._last_mask:
+            return
+
+        self._last_mask = ir_beacon_buttons_mask
+
+        action = self._table.get(ir_beacon_buttons_mask)
+
+        if action is None:
+            self._stop()
+
+        else:
+            self._drive(*action)
+
 
 class RemoteControlledTank:
     """
     This reusable mixin provides the capability of driving a robot
     with a Driving Base by the IR beacon
     """
+    CONTROL_LOOP_FREQUENCY = 50   # Hz
+
     def __init__(
             self,
             wheel_diameter: float, axle_track: float,   # both in milimeters
@@ -25,62 +143,54 @@ class RemoteControlledTank:
         self.ir_sensor = InfraredSensor(port=ir_sensor_port)
         self.ir_beacon_channel = ir_beacon_channel
 
+        self.ir_driver = \
+            IRBeaconDriver(
+                drive_base=self.driver,
+                ir_sensor=self.ir_sensor,
+                ir_beacon_channel=ir_beacon_channel)
+
+        self._tick_period_us = 1000000 // self.CONTROL_LOOP_FREQUENCY
+        self._next_tick = ticks_us()
+
+    def ir_beacon_driver(
+            self,
+            speed: float = 1000,    # mm/s
+            turn_rate: float = 90   # rotational speed deg/s
+            ) -> IRBeaconDriver:
+        """
+        Get the IR beacon driver for the given speed and turn rate,
+        replacing the current one if it was set up differently
+        """
+        if speed != self.ir_driver.speed \
+                or turn_rate != self.ir_driver.turn_rate:
+            self.ir_driver = \
+                IRBeaconDriver(
+                    drive_base=self.driver,
+                    ir_sensor=self.ir_sensor,
+                    ir_beacon_channel=self.ir_beacon_channel,
+                    speed=speed,
+                    turn_rate=turn_rate)
+
+        return self.ir_driver
+
     def drive_by_ir_beacon(
             self,
             speed: float = 1000,    # mm/s
             turn_rate: float = 90   # rotational speed deg/s
             ):
-        ir_beacon_button_pressed = \
-            set(self.ir_sensor.buttons(channel=self.ir_beacon_channel))
-
-        # forward
-        if ir_beacon_button_pressed == {Button.LEFT_UP, Button.RIGHT_UP}:
-            self.driver.drive(
-                speed=speed,
-                turn_rate=0)
-
-        # backward
-        elif ir_beacon_button_pressed == {Button.LEFT_DOWN, Button.RIGHT_DOWN}:
-            self.driver.drive(
-                speed=-speed,
-                turn_rate=0)
-
-        # turn left on the spot
-        elif ir_beacon_button_pressed == {Button.LEFT_UP, Button.RIGHT_DOWN}:
-            self.driver.drive(
-                speed=0,
-                turn_rate=-turn_rate)
-
-        # turn right on the spot
-        elif ir_beacon_button_pressed == {Button.RIGHT_UP, Button.LEFT_DOWN}:
-            self.driver.drive(
-                speed=0,
-                turn_rate=turn_rate)
-
-        # turn left forward
-        elif ir_beacon_button_pressed == {Button.LEFT_UP}:
-            self.driver.drive(
-                speed=speed,
-                turn_rate=-turn_rate)
-
-        # turn right forward
-        elif ir_beacon_button_pressed == {Button.RIGHT_UP}:
-            self.driver.drive(
-                speed=speed,
-                turn_rate=turn_rate)
-
-        # turn left backward
-        elif ir_beacon_button_pressed == {Button.LEFT_DOWN}:
-            self.driver.drive(
-                speed=-speed,
-                turn_rate=turn_rate)
-
-        # turn right backward
-        elif ir_beacon_button_pressed == {Button.RIGHT_DOWN}:
-            self.driver.drive(
-                speed=-speed,
-                turn_rate=-turn_rate)
-
-        # otherwise stop
+        self.ir_beacon_driver(speed=speed, turn_rate=turn_rate).step()
+
+    def sleep_until_next_tick(self):
+        """
+        Pace the main loop at CONTROL_LOOP_FREQUENCY
+        by sleeping for whatever is left of the current period
+        """
+        self._next_tick = ticks_add(self._next_tick, self._tick_period_us)
+        remaining_us = ticks_diff(self._next_tick, ticks_us())
+
+        if remaining_us > 0:
+            sleep_us(remaining_us)
+
         else:
-            self.driver.stop()
+            # running late: restart the schedule rather than bursting
+            self._next_tick = ticks_us()
@@ -17,6 +17,25 @@ from pybricks.media.ev3dev import SoundFile
 from pybricks.parameters import Button, Direction, Port, Stop
 from pybricks.tools import wait
 
+from micropython import const
+
+
+# bit assigned to each IR beacon button,
+# so that any combination of pressed buttons maps to a single int
+_LEFT_UP = const(1 << 0)
+_RIGHT_UP = const(1 << 1)
+_LEFT_DOWN = const(1 << 2)
+_RIGHT_DOWN = const(1 << 3)
+_BEACON = const(1 << 4)
+
+_BITS = {
+    Button.LEFT_UP: _LEFT_UP,
+    Button.RIGHT_UP: _RIGHT_UP,
+    Button.LEFT_DOWN: _LEFT_DOWN,
+    Button.RIGHT_DOWN: _RIGHT_DOWN,
+    Button.BEACON: _BEACON
+}
+
 
 class R3ptar:
     """
@@ -52,28 +71,29 @@ class R3ptar:
             self,
             speed: float = 1000,    # mm/s
             ):
-        ir_beacons_pressed = \
-            set(self.ir_sensor.buttons(channel=self.ir_beacon_channel))
+        ir_beacons_pressed = 0
+        for button in self.ir_sensor.buttons(channel=self.ir_beacon_channel):
+            ir_beacons_pressed |= _BITS[button]
 
-        if ir_beacons_pressed == {Button.LEFT_UP, Button.RIGHT_UP}:
+        if ir_beacons_pressed == _LEFT_UP | _RIGHT_UP:
             self.driving_motor.run(speed=speed)
 
-        elif ir_beacons_pressed == {Button.LEFT_DOWN, Button.RIGHT_DOWN}:
+        elif ir_beacons_pressed == _LEFT_DOWN | _RIGHT_DOWN:
             self.driving_motor.run(speed=-speed)
 
-        elif ir_beacons_pressed == {Button.LEFT_UP}:
+        elif ir_beacons_pressed == _LEFT_UP:
             self.steering_motor.run(speed=-500)
             self.driving_motor.run(speed=speed)
 
-        elif ir_beacons_pressed == {Button.RIGHT_UP}:
+        elif ir_beacons_pressed == _RIGHT_UP:
             self.steering_motor.run(speed=500)
             self.driving_motor.run(speed=speed)
 
-        elif ir_beacons_pressed == {Button.LEFT_DOWN}:
+        elif ir_beacons_pressed == _LEFT_DOWN:
             self.steering_motor.run(speed=-500)
             self.driving_motor.run(speed=-speed)
 
-        elif ir_beacons_pressed == {Button.RIGHT_DOWN}:
+        elif ir_beacons_pressed == _RIGHT_DOWN:
             self.steering_motor.run(speed=500)
             self.driving_motor.run(speed=-speed)
 
@@ -18,6 +18,25 @@ from pybricks.media.ev3dev import ImageFile, SoundFile
 from pybricks.parameters import Button, Direction, Port, Stop
 from pybricks.tools import wait
 
+from micropython import const
+
+
+# bit assigned to each IR beacon button,
+# so that any combination of pressed buttons maps to a single int
+_LEFT_UP = const(1 << 0)
+_RIGHT_UP = const(1 << 1)
+_LEFT_DOWN = const(1 << 2)
+_RIGHT_DOWN = const(1 << 3)
+_BEACON = const(1 << 4)
+
+_BITS = {
+    Button.LEFT_UP: _LEFT_UP,
+    Button.RIGHT_UP: _RIGHT_UP,
+    Button.LEFT_DOWN: _LEFT_DOWN,
+    Button.RIGHT_DOWN: _RIGHT_DOWN,
+    Button.BEACON: _BEACON
+}
+
 
 class Spik3r:
     def __init__(
@@ -84,13 +103,14 @@ class Spik3r:
         and turns right when only the Right Up button is pressed
         (inspiration from LEGO Mindstorms EV3 Home Ed.: Spik3r: Tutorial #2)
         """
-        ir_buttons_pressed = \
-            set(self.ir_sensor.buttons(channel=self.ir_beacon_channel))
+        ir_buttons_pressed = 0
+        for button in self.ir_sensor.buttons(channel=self.ir_beacon_channel):
+            ir_buttons_pressed |= _BITS[button]
 
-        if ir_buttons_pressed == {Button.RIGHT_UP, Button.LEFT_UP}:
+        if ir_buttons_pressed == _RIGHT_UP | _LEFT_UP:
             self.moving_motor.run(speed=speed)
 
-        elif ir_buttons_pressed == {Button.RIGHT_UP}:
+        elif ir_buttons_pressed == _RIGHT_UP:
             self.moving_motor.run(speed=-speed)
 
         else: